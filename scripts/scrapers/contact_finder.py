@@ -8,23 +8,136 @@ Implements the strict "email must have source URL" rule.
 import asyncio
 import aiohttp
 import re
-from typing import Optional, List, Tuple
-from dataclasses import dataclass
-from bs4 import BeautifulSoup
+from typing import Optional, List, Tuple, Dict
+from dataclasses import dataclass, field
+from operator import attrgetter
+from html import unescape
 from urllib.parse import urlparse, urljoin
 import logging
 
+from utils.scraping import EMAIL_RE, PAGES_PER_SITE, make_session
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Compiled once at import; these run for every scraped page and candidate email
+_VALID_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Only mailto anchors are needed from the markup, so match them directly
+# instead of building a DOM: group 1 is the address, group 2 the link text
+_MAILTO_LINK_RE = re.compile(
+    rb'<a\b[^>]*?\shref\s*=\s*["\']?\s*mailto:([^"\'\s>]*)[^>]*>(.*?)</a>',
+    re.I | re.S
+)
+# Start of a mailto anchor, to find one whose </a> hasn't downloaded yet
+_MAILTO_OPEN_RE = re.compile(rb'<a\b[^>]*?\shref\s*=\s*["\']?\s*mailto:', re.I)
+_TAG_RE = re.compile(rb'<[^>]+>')
+
+# Website pages to check (in priority order). The priority pages yield a
+# booking contact most of the time; the fallbacks are only tried without one
+_PRIORITY_PATHS = (
+    "/contact",
+    "/be-a-guest",
+    "",  # Homepage
+)
+_FALLBACK_PATHS = (
+    "/contact-us",
+    "/guest",
+    "/podcast",
+    "/about",
+    "/media",
+    "/press",
+    "/booking",
+)
+
+# Rank order of contact types (lower is better)
+_TYPE_PRIORITY = {
+    "booking": 0,
+    "host": 1,
+    "producer": 2,
+    "general": 3
+}
+
+# Pages are streamed in chunks and never read past _MAX_PAGE_BYTES
+_CHUNK_SIZE = 16_384
+_MAX_PAGE_BYTES = 512_000
+# Tail of the buffer a match may still grow into once the next chunk arrives
+_SCAN_OVERLAP = 1_024
+
+# Patterns for identifying contact types. Booking and producer keywords share
+# one scan; the name of the matching group is the contact type.
+_CONTACT_TYPE_RE = re.compile(
+    r'(?P<booking>booking|guest|podcast|media|inquir|press|interview)'
+    r'|(?P<producer>producer|production)'
+)
+# Personal mailbox domains (host)
+_PERSONAL_DOMAINS = frozenset({
+    'gmail.com', 'yahoo.com', 'outlook.com', 'icloud.com', 'me.com',
+})
+
+# Placeholder domains that never belong to a real contact
+_BAD_DOMAINS = frozenset({'example.com', 'example.org', 'test.com'})
+
+# Spam traps and scraper false positives, matched in a single scan
+_SKIP_RE = re.compile('|'.join(map(re.escape, [
+    'noreply', 'no-reply', 'donotreply', 'mailer-daemon',
+    '.png', '.jpg', '.gif', '.svg',  # False positives
+    'wixpress', 'sentry.io', 'cloudflare',  # Infrastructure
+    'privacy@', 'abuse@', 'postmaster@', 'webmaster@',
+])))
+
+
+@dataclass(slots=True)
 class ContactResult:
     """A verified contact with source"""
     email: str
     source_url: str  # REQUIRED - where this email was found
     contact_type: str  # "booking", "host", "producer", "general"
     confidence: float  # 0.0 to 1.0
+    # Precomputed ranking key: contact_type priority, then confidence
+    _sort_key: Tuple[int, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._sort_key = (_TYPE_PRIORITY.get(self.contact_type, 99), -self.confidence)
+
+
+def _is_booking_hit(contact: ContactResult) -> bool:
+    """A booking email found via mailto - nothing else can outrank it"""
+    return contact.contact_type == "booking" and contact.confidence >= 0.9
+
+
+def _complete_matches(
+    pattern: re.Pattern,
+    buffer: bytearray,
+    pos: int,
+    final: bool
+) -> Tuple[List[re.Match], int]:
+    """
+    Find matches in a partially downloaded buffer, starting at pos.
+
+    Until the final chunk, a match running into the last _SCAN_OVERLAP bytes
+    could still change, so it is left for the next call.
+    Returns the complete matches and the offset to resume from.
+    """
+    safe_end = len(buffer) if final else len(buffer) - _SCAN_OVERLAP
+    matches = []
+    for match in pattern.finditer(buffer, pos):
+        if match.end() > safe_end:
+            return matches, match.start()
+        matches.append(match)
+        pos = match.end()
+    return matches, max(pos, safe_end)
+
+
+def _unclosed_tag_start(buffer: bytearray, pos: int) -> int:
+    """
+    Offset of a tag opened at or after pos whose '>' hasn't arrived yet.
+
+    Returns -1 when every tag in the scanned region is closed.
+    """
+    start = buffer.rfind(b'<', pos)
+    if start == -1 or buffer.find(b'>', start) != -1:
+        return -1
+    return start
 
 
 class ContactFinder:
@@ -35,29 +148,20 @@ class ContactFinder:
     If we can't prove where we found the email, we don't use it.
     """
 
-    def __init__(self):
-        self.session: Optional[aiohttp.ClientSession] = None
-
-        # Patterns for identifying contact types
-        self.booking_patterns = [
-            r'booking', r'guest', r'podcast', r'media',
-            r'inquir', r'press', r'interview'
-        ]
-        self.host_patterns = [
-            r'@gmail\.com', r'@yahoo\.com', r'@outlook\.com',
-            r'@icloud\.com', r'@me\.com'
-        ]
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        # An injected session is shared with the caller and left open on exit
+        self.session = session
+        self._owns_session = session is None
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            headers={"User-Agent": "PodcastOutreach/1.0"},
-            timeout=aiohttp.ClientTimeout(total=30)
-        )
+        if self.session is None:
+            self.session = make_session(timeout=aiohttp.ClientTimeout(total=30))
         return self
 
     async def __aexit__(self, *args):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
 
     async def find_contacts(
         self,
@@ -71,19 +175,19 @@ class ContactFinder:
         Returns: (primary_contact, backup_contact)
         Both will have source_url populated, or be None.
         """
-        all_contacts = []
+        # Contacts deduped as they are found, keyed by lowercased email
+        seen: Dict[str, ContactResult] = {}
 
         # 1. Check podcast website
         if website_url:
-            website_contacts = await self._scan_website(website_url)
-            all_contacts.extend(website_contacts)
+            await self._scan_website(website_url, seen)
 
         # 2. Check common podcast directories
-        directory_contacts = await self._check_directories(podcast_name)
-        all_contacts.extend(directory_contacts)
+        for contact in await self._check_directories(podcast_name):
+            self._add_contact(seen, contact)
 
-        # 3. Rank and dedupe contacts
-        ranked = self._rank_contacts(all_contacts)
+        # 3. Rank contacts
+        ranked = self._rank_contacts(seen)
 
         # Return top 2
         primary = ranked[0] if len(ranked) > 0 else None
@@ -91,80 +195,165 @@ class ContactFinder:
 
         return primary, backup
 
-    async def _scan_website(self, base_url: str) -> List[ContactResult]:
-        """Scan podcast website for contact emails"""
-        contacts = []
-
-        # Pages to check (in priority order)
-        paths_to_check = [
-            "/contact",
-            "/contact-us",
-            "/be-a-guest",
-            "/guest",
-            "/podcast",
-            "/about",
-            "/media",
-            "/press",
-            "/booking",
-            "",  # Homepage
+    async def _scan_website(
+        self,
+        base_url: str,
+        seen: Dict[str, ContactResult]
+    ) -> None:
+        """Scan podcast website for contact emails, adding them to seen"""
+        # The highest-yield pages go first; the rest are only fetched when
+        # those turn up no high-confidence booking contact
+        if await self._scan_paths(base_url, _PRIORITY_PATHS, seen):
+            return
+        await self._scan_paths(base_url, _FALLBACK_PATHS, seen)
+
+    async def _scan_paths(
+        self,
+        base_url: str,
+        paths: Tuple[str, ...],
+        seen: Dict[str, ContactResult]
+    ) -> bool:
+        """Scan the given website paths, returning True on a booking hit"""
+        # Bounds how many pages of this site are fetched at once
+        site_sem = asyncio.Semaphore(PAGES_PER_SITE)
+        tasks = [
+            asyncio.ensure_future(
+                self._scrape_page_for_emails(f"{base_url.rstrip('/')}{path}", site_sem)
+            )
+            for path in paths
         ]
 
-        for path in paths_to_check:
-            url = f"{base_url.rstrip('/')}{path}"
-            page_contacts = await self._scrape_page_for_emails(url)
-            contacts.extend(page_contacts)
+        # Fetch all pages concurrently, stopping once a page yields a
+        # high-confidence booking contact - nothing else would outrank it
+        hit = False
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                if any(
+                    _is_booking_hit(c)
+                    for task in done
+                    for c in task.result().values()
+                ):
+                    hit = True
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        # Merge in priority order, skipping pages that were cancelled
+        for task in tasks:
+            if not task.cancelled():
+                for contact in task.result().values():
+                    self._add_contact(seen, contact)
+
+        return hit
+
+    async def _scrape_page_for_emails(
+        self,
+        url: str,
+        site_sem: asyncio.Semaphore
+    ) -> Dict[str, ContactResult]:
+        """Scrape a single page for emails, keyed by lowercased email"""
+        contacts = {}
+
+        async with site_sem:
+            try:
+                async with self.session.get(url) as resp:
+                    if resp.status != 200:
+                        return contacts
+
+                    # Scan the page as it downloads, so a large page stops
+                    # downloading once a booking contact turns up
+                    body = bytearray()
+                    offsets = (0, 0)
+                    async for chunk in resp.content.iter_chunked(_CHUNK_SIZE):
+                        body += chunk
+                        final = len(body) >= _MAX_PAGE_BYTES
+                        offsets = self._scan_page(body, url, contacts, offsets, final)
+                        if final or any(map(_is_booking_hit, contacts.values())):
+                            resp.close()
+                            break
+                    else:
+                        self._scan_page(body, url, contacts, offsets, final=True)
+
+            except Exception as e:
+                logger.warning(f"Error scraping {url}: {e}")
 
         return contacts
 
-    async def _scrape_page_for_emails(self, url: str) -> List[ContactResult]:
-        """Scrape a single page for emails"""
-        contacts = []
+    def _scan_page(
+        self,
+        body: bytearray,
+        url: str,
+        contacts: Dict[str, ContactResult],
+        offsets: Tuple[int, int],
+        final: bool
+    ) -> Tuple[int, int]:
+        """
+        Scan the downloaded part of a page for emails, adding them to contacts.
 
-        try:
-            async with self.session.get(url) as resp:
-                if resp.status != 200:
-                    return contacts
-
-                html = await resp.text()
-                soup = BeautifulSoup(html, 'html.parser')
-
-                # Method 1: mailto: links (highest confidence)
-                mailto_links = soup.find_all('a', href=re.compile(r'^mailto:', re.I))
-                for link in mailto_links:
-                    href = link.get('href', '')
-                    email = href.replace('mailto:', '').split('?')[0].strip()
-
-                    if self._is_valid_email(email):
-                        contact_type = self._classify_email(email, link.get_text())
-                        contacts.append(ContactResult(
-                            email=email.lower(),
-                            source_url=url,
-                            contact_type=contact_type,
-                            confidence=0.9 if contact_type == "booking" else 0.7
-                        ))
-
-                # Method 2: Email patterns in text (lower confidence)
-                email_pattern = re.compile(
-                    r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,7}\b'
+        offsets are where the mailto and text scans stopped last time; the
+        updated offsets are returned for the next chunk.
+        """
+        mailto_pos, email_pos = offsets
+
+        # Method 1: mailto: links (highest confidence)
+        # Most pages have none, so skip the anchor scan unless one is present
+        if body.find(b'mailto:', mailto_pos) != -1 or body.find(b'MAILTO:', mailto_pos) != -1:
+            links, next_pos = _complete_matches(_MAILTO_LINK_RE, body, mailto_pos, final)
+            if not final:
+                # An anchor whose </a> is still to come (e.g. after an inline
+                # SVG icon) matches nothing yet; resume from its start rather
+                # than skipping past it
+                pending = _MAILTO_OPEN_RE.search(
+                    body, links[-1].end() if links else mailto_pos
+                )
+                if pending:
+                    next_pos = min(next_pos, pending.start())
+            mailto_pos = next_pos
+            for link in links:
+                href = link.group(1).decode('utf-8', 'replace')
+                email = unescape(href).split('?')[0].strip()
+
+                if self._is_valid_email(email):
+                    link_text = unescape(
+                        _TAG_RE.sub(b'', link.group(2)).decode('utf-8', 'replace')
+                    )
+                    contact_type = self._classify_email(email, link_text)
+                    self._add_contact(contacts, ContactResult(
+                        email=email.lower(),
+                        source_url=url,
+                        contact_type=contact_type,
+                        confidence=0.9 if contact_type == "booking" else 0.7
+                    ))
+        else:
+            mailto_pos = len(body)
+        if not final:
+            # An anchor may have started without its mailto: yet, behind any
+            # number of attributes; resume from its '<' so it is seen whole
+            open_tag = _unclosed_tag_start(body, offsets[0])
+            if open_tag != -1:
+                mailto_pos = min(mailto_pos, open_tag)
+
+        # Method 2: Email patterns in text (lower confidence)
+        matches, email_pos = _complete_matches(EMAIL_RE, body, email_pos, final)
+        for match in matches:
+            email = match.group().decode('ascii')
+            # Skip anything already found via mailto or earlier in the text
+            if email.lower() not in contacts and self._is_valid_email(email):
+                contact_type = self._classify_email(email, "")
+                contacts[email.lower()] = ContactResult(
+                    email=email.lower(),
+                    source_url=url,
+                    contact_type=contact_type,
+                    confidence=0.6
                 )
-                text_emails = email_pattern.findall(html)
-
-                for email in text_emails:
-                    if self._is_valid_email(email):
-                        # Check if already found via mailto
-                        if not any(c.email == email.lower() for c in contacts):
-                            contact_type = self._classify_email(email, "")
-                            contacts.append(ContactResult(
-                                email=email.lower(),
-                                source_url=url,
-                                contact_type=contact_type,
-                                confidence=0.6
-                            ))
-
-        except Exception as e:
-            logger.warning(f"Error scraping {url}: {e}")
 
-        return contacts
+        return mailto_pos, email_pos
 
     async def _check_directories(self, podcast_name: str) -> List[ContactResult]:
         """Check podcast directories for contact info"""
@@ -189,20 +378,13 @@ class ContactFinder:
         email_lower = email.lower()
 
         # Skip patterns
-        skip_patterns = [
-            'noreply', 'no-reply', 'donotreply', 'mailer-daemon',
-            'example.com', 'example.org', 'test.com',
-            '.png', '.jpg', '.gif', '.svg',  # False positives
-            'wixpress', 'sentry.io', 'cloudflare',  # Infrastructure
-            'privacy@', 'abuse@', 'postmaster@', 'webmaster@',
-        ]
-
-        for pattern in skip_patterns:
-            if pattern in email_lower:
-                return False
+        if email_lower.rpartition('@')[2] in _BAD_DOMAINS:
+            return False
+        if _SKIP_RE.search(email_lower):
+            return False
 
         # Basic format check
-        if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
+        if not _VALID_EMAIL_RE.match(email):
             return False
 
         return True
@@ -211,44 +393,40 @@ class ContactFinder:
         """Classify email as booking, host, producer, or general"""
         combined = f"{email} {context}".lower()
 
-        # Check for booking/guest patterns (highest priority)
-        for pattern in self.booking_patterns:
-            if re.search(pattern, combined):
+        # Check for booking/guest patterns (highest priority), noting producer
+        # signals on the way so the context isn't scanned again
+        is_producer = False
+        for match in _CONTACT_TYPE_RE.finditer(combined):
+            if match.lastgroup == "booking":
                 return "booking"
+            is_producer = True
 
-        # Check for personal email patterns (host)
-        for pattern in self.host_patterns:
-            if re.search(pattern, email.lower()):
-                return "host"
+        # Check for personal email domains (host)
+        if email.rpartition('@')[2].lower() in _PERSONAL_DOMAINS:
+            return "host"
 
         # Check context for producer signals
-        if 'producer' in combined or 'production' in combined:
+        if is_producer:
             return "producer"
 
         return "general"
 
-    def _rank_contacts(self, contacts: List[ContactResult]) -> List[ContactResult]:
-        """Rank and dedupe contacts, returning best options"""
-        # Remove duplicates (keep highest confidence)
-        seen = {}
-        for contact in contacts:
-            if contact.email not in seen or contact.confidence > seen[contact.email].confidence:
-                seen[contact.email] = contact
-
+    def _add_contact(
+        self,
+        seen: Dict[str, ContactResult],
+        contact: ContactResult
+    ) -> None:
+        """Record a contact, keeping the highest-confidence one per email"""
+        current = seen.get(contact.email)
+        if current is None or contact.confidence > current.confidence:
+            seen[contact.email] = contact
+
+    def _rank_contacts(self, seen: Dict[str, ContactResult]) -> List[ContactResult]:
+        """Rank deduped contacts, returning best options"""
         unique = list(seen.values())
 
         # Sort by: contact_type priority, then confidence
-        type_priority = {
-            "booking": 0,
-            "host": 1,
-            "producer": 2,
-            "general": 3
-        }
-
-        unique.sort(key=lambda c: (
-            type_priority.get(c.contact_type, 99),
-            -c.confidence
-        ))
+        unique.sort(key=attrgetter('_sort_key'))
 
         return unique
 
@@ -6,22 +6,93 @@ Outputs structured data ready for database import.
 
 import asyncio
 import aiohttp
-import json
+import orjson
 import re
 import hashlib
-from dataclasses import dataclass, asdict
-from typing import Optional, List
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, List, Dict
 from datetime import datetime
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urlparse, quote_plus
 import logging
 import os
+import time
+from html import unescape
+
+from utils.scraping import EMAIL_RE, HTML_PARSER, PAGES_PER_SITE, make_session
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _keyword_re(terms: List[str]) -> re.Pattern:
+    """Compile a keyword list into one alternation so content is scanned once"""
+    return re.compile('|'.join(map(re.escape, terms)))
+
+
+# Compiled once at import; these run for every discovered show and scraped page
+# Matches the address of <a href="mailto:..."> anchors without building a DOM
+_MAILTO_LINK_RE = re.compile(rb'<a\b[^>]*?\shref\s*=\s*["\']?\s*mailto:([^"\'\s>]*)', re.I)
+_APPLE_ID_RE = re.compile(r'/id(\d+)', re.ASCII)  # ASCII digits, as in the web app's JS
+_SPOTIFY_RE = re.compile(r'/show/([a-zA-Z0-9]+)')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+_WEBSITE_LINK_RE = re.compile(r'^https?://(?!podcasts\.apple)')
+# The channel <link> (the show's website) comes first in an RSS feed
+_FEED_LINK_RE = re.compile(rb'<link>\s*(https?://[^<\s]+)\s*</link>')
+# Only build tree nodes for the candidate website links on Apple pages
+_WEBSITE_LINK_STRAINER = SoupStrainer('a', class_='link')
+
+# Podcasts enriched at once; with PAGES_PER_SITE each, this stays well under
+# the shared connector's 200-connection limit
+_MAX_CONCURRENT_ENRICHMENTS = 20
+
+# Common non-contact emails, matched in a single scan
+_SKIP_RE = _keyword_re([
+    'noreply', 'no-reply', 'donotreply',
+    'info@', 'support@', 'help@',
+    'privacy@', 'legal@', 'abuse@',
+    '.png', '.jpg', '.gif',  # False positives from images
+])
+
+# Stop rule triggers, mapped to the risk signal each one raises
+_RISK_TERMS = {
+    # Political signals
+    **dict.fromkeys(['democrat', 'republican', 'trump', 'biden', 'maga',
+                     'liberal', 'conservative', 'political'], "POTENTIAL_POLITICS"),
+    # Explicit signals
+    **dict.fromkeys(['explicit', 'adult', 'nsfw', '18+'], "POTENTIAL_EXPLICIT"),
+    # Paid guest signals
+    **dict.fromkeys(['sponsor a slot', 'guest sponsorship', 'paid guest',
+                     'buy a spot', 'sponsor an episode'], "POTENTIAL_PAID_GUEST"),
+    # No guests signals
+    **dict.fromkeys(['solo show', 'no interviews', 'monologue', 'solo podcast'],
+                    "POTENTIAL_NO_GUESTS"),
+}
+_RISK_SIGNALS = list(dict.fromkeys(_RISK_TERMS.values()))
+_RISK_RE = _keyword_re(list(_RISK_TERMS))
+
+
+@lru_cache(maxsize=4096)
+def _hash_key(url: str, show_name: str) -> str:
+    """
+    Fallback dedupe key. The same shows come back across searches, so keys
+    are cached. MD5 is kept (as a plain checksum, not for security) because
+    the web app's generateDedupeKey produces the same "hash:" keys.
+    """
+    digest = hashlib.md5(f'{url}{show_name}'.encode(), usedforsecurity=False)
+    return f"hash:{digest.hexdigest()[:12]}"
+
+
+@lru_cache(maxsize=2)
+def _podcast_index_auth(key: str, secret: str, epoch_time: int) -> str:
+    """Podcast Index auth hash; it only changes once a second, so bursts reuse it"""
+    return hashlib.sha1(
+        f"{key}{secret}{epoch_time}".encode(), usedforsecurity=False
+    ).hexdigest()
+
+
+@dataclass(slots=True)
 class PodcastDiscoveryResult:
     """Structured output from discovery"""
     show_name: str
@@ -42,7 +113,8 @@ class PodcastDiscoveryResult:
     dedupe_key: str
 
     def to_dict(self):
-        return asdict(self)
+        # Shallow: the list fields are shared, not deep-copied as asdict() would
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 class PodcastDiscoveryEngine:
@@ -61,72 +133,69 @@ class PodcastDiscoveryEngine:
         listen_notes_api_key: Optional[str] = None,
         podcast_index_key: Optional[str] = None,
         podcast_index_secret: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
     ):
         self.listen_notes_key = listen_notes_api_key
         self.podcast_index_key = podcast_index_key
         self.podcast_index_secret = podcast_index_secret
-        self.session: Optional[aiohttp.ClientSession] = None
+        # An injected session is shared with the caller and left open on exit
+        self.session = session
+        self._owns_session = session is None
+        # Bounds how many podcasts are enriched at once; each one fetches its
+        # feed or Apple page and up to PAGES_PER_SITE pages of its website
+        self._enrich_sem = asyncio.Semaphore(_MAX_CONCURRENT_ENRICHMENTS)
+        # RSS feed URLs keyed by Apple ID, filled by searches and /lookup calls
+        self._apple_feed_urls: Dict[str, str] = {}
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            headers={"User-Agent": "PodcastOutreach/1.0"}
-        )
+        if self.session is None:
+            self.session = make_session()
         return self
 
     async def __aexit__(self, *args):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
 
     def _generate_dedupe_key(self, url: str, show_name: str) -> str:
         """Generate unique identifier for deduplication"""
         parsed = urlparse(url)
 
         # Apple Podcasts ID extraction
-        apple_match = re.search(r'/id(\d+)', url)
+        apple_match = _APPLE_ID_RE.search(url)
         if apple_match:
             return f"apple:{apple_match.group(1)}"
 
         # Spotify ID extraction
-        spotify_match = re.search(r'/show/([a-zA-Z0-9]+)', url)
+        spotify_match = _SPOTIFY_RE.search(url)
         if spotify_match:
             return f"spotify:{spotify_match.group(1)}"
 
         # Website-based key
         if parsed.netloc:
-            normalized_name = re.sub(r'[^a-z0-9]', '', show_name.lower())
+            normalized_name = _NON_ALNUM_RE.sub('', show_name.lower())
             return f"web:{parsed.netloc}|{normalized_name}"
 
         # Fallback hash
-        return f"hash:{hashlib.md5(f'{url}{show_name}'.encode()).hexdigest()[:12]}"
+        return _hash_key(url, show_name)
 
     def _detect_risk_signals(self, title: str, description: str) -> List[str]:
         """Detect potential stop rule triggers"""
-        signals = []
-        content = f"{title} {description}".lower()
-
-        # Political signals
-        political_terms = ['democrat', 'republican', 'trump', 'biden', 'maga',
-                         'liberal', 'conservative', 'political']
-        if any(term in content for term in political_terms):
-            signals.append("POTENTIAL_POLITICS")
-
-        # Explicit signals
-        explicit_terms = ['explicit', 'adult', 'nsfw', '18+']
-        if any(term in content for term in explicit_terms):
-            signals.append("POTENTIAL_EXPLICIT")
+        # Shows often come back without a description; skip the scan entirely
+        # when there's nothing to look at
+        if not (title or description):
+            return []
 
-        # Paid guest signals
-        paid_terms = ['sponsor a slot', 'guest sponsorship', 'paid guest',
-                     'buy a spot', 'sponsor an episode']
-        if any(term in content for term in paid_terms):
-            signals.append("POTENTIAL_PAID_GUEST")
+        content = f"{title} {description}".lower()
 
-        # No guests signals
-        no_guest_terms = ['solo show', 'no interviews', 'monologue', 'solo podcast']
-        if any(term in content for term in no_guest_terms):
-            signals.append("POTENTIAL_NO_GUESTS")
+        # One pass over the content for every term, then report in signal order
+        found = set()
+        for match in _RISK_RE.finditer(content):
+            found.add(_RISK_TERMS[match.group()])
+            if len(found) == len(_RISK_SIGNALS):
+                break
 
-        return signals
+        return [signal for signal in _RISK_SIGNALS if signal in found]
 
     async def search_by_seed_guest(
         self,
@@ -209,8 +278,12 @@ class PodcastDiscoveryEngine:
         try:
             async with self.session.get(url, params=params) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = orjson.loads(await resp.read())
                     for item in data.get("results", []):
+                        # Search results carry the feed URL; keep it so
+                        # enrichment doesn't have to look it up again
+                        if item.get("collectionId") and item.get("feedUrl"):
+                            self._apple_feed_urls[str(item["collectionId"])] = item["feedUrl"]
                         podcast = PodcastDiscoveryResult(
                             show_name=item.get("collectionName", ""),
                             host_name=item.get("artistName"),
@@ -250,16 +323,14 @@ class PodcastDiscoveryEngine:
         if not self.podcast_index_key:
             return []
 
-        import time
-
         results = []
         url = "https://api.podcastindex.org/api/1.0/search/byterm"
 
         # Generate auth headers for Podcast Index
         epoch_time = int(time.time())
-        auth_hash = hashlib.sha1(
-            f"{self.podcast_index_key}{self.podcast_index_secret}{epoch_time}".encode()
-        ).hexdigest()
+        auth_hash = _podcast_index_auth(
+            self.podcast_index_key, self.podcast_index_secret, epoch_time
+        )
 
         headers = {
             "X-Auth-Key": self.podcast_index_key,
@@ -272,7 +343,7 @@ class PodcastDiscoveryEngine:
         try:
             async with self.session.get(url, params=params, headers=headers) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = orjson.loads(await resp.read())
                     for item in data.get("feeds", []):
                         podcast = PodcastDiscoveryResult(
                             show_name=item.get("title", ""),
@@ -328,7 +399,7 @@ class PodcastDiscoveryEngine:
         try:
             async with self.session.get(url, params=params, headers=headers) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = orjson.loads(await resp.read())
 
                     # Extract unique podcasts from episodes
                     seen_podcasts = {}
@@ -368,9 +439,46 @@ class PodcastDiscoveryEngine:
         podcast: PodcastDiscoveryResult
     ) -> PodcastDiscoveryResult:
         """Enrich a podcast with additional data"""
+        # A single show isn't worth a /lookup round-trip; use the feed URL
+        # from the search if there is one, otherwise scrape the Apple page
+        async with self._enrich_sem:
+            return await self._enrich_podcast(podcast)
+
+    async def enrich_podcasts(
+        self,
+        podcasts: List[PodcastDiscoveryResult]
+    ) -> List[PodcastDiscoveryResult]:
+        """Enrich podcasts with additional data, batching Apple lookups"""
+        # One iTunes lookup covers every Apple show that still needs a website
+        # and whose feed URL didn't come with the search results
+        apple_ids = []
+        for podcast in podcasts:
+            if not podcast.website_url and podcast.apple_podcast_url:
+                apple_match = _APPLE_ID_RE.search(podcast.apple_podcast_url)
+                if apple_match and apple_match.group(1) not in self._apple_feed_urls:
+                    apple_ids.append(apple_match.group(1))
+        self._apple_feed_urls.update(await self._lookup_apple_feeds(apple_ids))
+
+        async def enrich(podcast: PodcastDiscoveryResult) -> PodcastDiscoveryResult:
+            async with self._enrich_sem:
+                return await self._enrich_podcast(podcast)
+
+        return list(await asyncio.gather(*(enrich(podcast) for podcast in podcasts)))
+
+    async def _enrich_podcast(
+        self,
+        podcast: PodcastDiscoveryResult
+    ) -> PodcastDiscoveryResult:
+        """Enrich a single podcast, reading its RSS feed when the URL is known"""
         # Try to find website if not present
         if not podcast.website_url and podcast.primary_platform_url:
-            podcast.website_url = await self._find_website(podcast)
+            apple_match = _APPLE_ID_RE.search(podcast.apple_podcast_url or "")
+            feed_url = self._apple_feed_urls.get(apple_match.group(1)) if apple_match else None
+            if feed_url:
+                podcast.website_url = await self._website_from_feed(feed_url)
+            # Scrape the Apple page only when the feed didn't name a website
+            if not podcast.website_url:
+                podcast.website_url = await self._find_website(podcast)
 
         # Find emails from website
         if podcast.website_url:
@@ -384,6 +492,45 @@ class PodcastDiscoveryEngine:
 
         return podcast
 
+    async def _lookup_apple_feeds(self, apple_ids: List[str]) -> Dict[str, str]:
+        """Look up RSS feed URLs for Apple Podcasts IDs, up to 200 per request"""
+        feed_urls = {}
+        url = "https://itunes.apple.com/lookup"
+
+        for i in range(0, len(apple_ids), 200):
+            params = {"id": ",".join(apple_ids[i:i + 200]), "entity": "podcast"}
+            try:
+                async with self.session.get(url, params=params) as resp:
+                    if resp.status == 200:
+                        data = orjson.loads(await resp.read())
+                        for item in data.get("results", []):
+                            if item.get("collectionId") and item.get("feedUrl"):
+                                feed_urls[str(item["collectionId"])] = item["feedUrl"]
+            except Exception as e:
+                logger.error(f"Apple Podcasts lookup error: {e}")
+
+        return feed_urls
+
+    async def _website_from_feed(self, feed_url: str) -> Optional[str]:
+        """Read the website link from the top of a podcast's RSS feed"""
+        try:
+            async with self.session.get(feed_url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status != 200:
+                    return None
+
+                # The channel header is near the top; don't download every episode
+                head = bytearray()
+                async for chunk in resp.content.iter_chunked(16_384):
+                    head += chunk
+                    link_match = _FEED_LINK_RE.search(head)
+                    if link_match:
+                        return unescape(link_match.group(1).decode('utf-8', 'replace'))
+                    if len(head) >= 65_536:
+                        break
+        except Exception as e:
+            logger.error(f"Feed website lookup error: {e}")
+        return None
+
     async def _find_website(self, podcast: PodcastDiscoveryResult) -> Optional[str]:
         """Try to find the podcast's website"""
         # Scrape Apple Podcasts page for website link
@@ -391,10 +538,12 @@ class PodcastDiscoveryEngine:
             try:
                 async with self.session.get(podcast.apple_podcast_url) as resp:
                     if resp.status == 200:
-                        html = await resp.text()
-                        soup = BeautifulSoup(html, 'html.parser')
+                        body = await resp.read()
+                        soup = BeautifulSoup(
+                            body, HTML_PARSER, parse_only=_WEBSITE_LINK_STRAINER
+                        )
                         # Look for website link
-                        website_link = soup.find('a', class_='link', href=re.compile(r'^https?://(?!podcasts\.apple)'))
+                        website_link = soup.find('a', class_='link', href=_WEBSITE_LINK_RE)
                         if website_link:
                             return website_link.get('href')
             except Exception as e:
@@ -413,54 +562,64 @@ class PodcastDiscoveryEngine:
             f"{website_url.rstrip('/')}/be-a-guest",
         ]
 
-        email_pattern = re.compile(
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+        # Fetch the pages concurrently, a few at a time per site; a page that
+        # fails is simply skipped
+        site_sem = asyncio.Semaphore(PAGES_PER_SITE)
+        pages = await asyncio.gather(
+            *(self._scrape_page_emails(url, site_sem) for url in urls_to_check),
+            return_exceptions=True,
         )
 
-        for url in urls_to_check:
-            try:
-                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status == 200:
-                        html = await resp.text()
-                        # Find emails in href="mailto:..."
-                        soup = BeautifulSoup(html, 'html.parser')
-                        mailto_links = soup.find_all('a', href=re.compile(r'^mailto:'))
-                        for link in mailto_links:
-                            email = link.get('href').replace('mailto:', '').split('?')[0]
+        seen = set()
+        for page in pages:
+            if isinstance(page, BaseException):
+                continue
+            for found in page:
+                if found["email"] not in seen:
+                    seen.add(found["email"])
+                    emails.append(found)
+
+        return emails[:2]  # Return max 2 emails
+
+    async def _scrape_page_emails(
+        self,
+        url: str,
+        site_sem: asyncio.Semaphore,
+    ) -> List[dict]:
+        """Find contact emails on a single page"""
+        emails = []
+        seen = set()
+
+        async with site_sem:
+            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status == 200:
+                    body = await resp.read()
+                    # Find emails in href="mailto:..."
+                    if b'mailto:' in body or b'MAILTO:' in body:
+                        for link in _MAILTO_LINK_RE.finditer(body):
+                            email = unescape(link.group(1).decode('utf-8', 'replace')).split('?')[0]
                             if self._is_valid_contact_email(email):
+                                seen.add(email)
                                 emails.append({"email": email, "source": url})
 
-                        # Find emails in text
-                        found = email_pattern.findall(html)
-                        for email in found:
-                            if self._is_valid_contact_email(email) and email not in [e["email"] for e in emails]:
-                                emails.append({"email": email, "source": url})
-            except Exception:
-                continue
+                    # Find emails in text
+                    for match in EMAIL_RE.finditer(body):
+                        email = match.group().decode('ascii')
+                        if email not in seen and self._is_valid_contact_email(email):
+                            seen.add(email)
+                            emails.append({"email": email, "source": url})
 
-        return emails[:2]  # Return max 2 emails
+        return emails
 
     def _is_valid_contact_email(self, email: str) -> bool:
         """Check if email is a valid contact email (not spam-trap or generic)"""
         email_lower = email.lower()
 
         # Skip common non-contact emails
-        skip_patterns = [
-            'noreply', 'no-reply', 'donotreply',
-            'info@', 'support@', 'help@',
-            'privacy@', 'legal@', 'abuse@',
-            '.png', '.jpg', '.gif',  # False positives from images
-        ]
-
-        for pattern in skip_patterns:
-            if pattern in email_lower:
-                return False
-
-        # Prefer booking/guest/contact emails
-        good_patterns = ['booking', 'guest', 'contact', 'podcast', 'hello', 'hi@']
-        is_preferred = any(p in email_lower for p in good_patterns)
+        if _SKIP_RE.search(email_lower):
+            return False
 
-        return True  # Accept all others but prefer booking emails
+        return True  # Accept all others
 
 
 async def main():
@@ -475,9 +634,8 @@ async def main():
         # Search by seed guest
         results = await engine.search_by_seed_guest("Gary Vaynerchuk", max_results=10)
 
-        for podcast in results:
-            enriched = await engine.enrich_podcast(podcast)
-            print(json.dumps(enriched.to_dict(), indent=2))
+        for enriched in await engine.enrich_podcasts(results):
+            print(orjson.dumps(enriched.to_dict(), option=orjson.OPT_INDENT_2).decode())
 
 
 if __name__ == "__main__":
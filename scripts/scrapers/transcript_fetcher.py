@@ -5,7 +5,10 @@ Fetches transcripts from YouTube videos and podcast episodes
 """
 
 import re
+import string
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property
 from typing import List, Optional
 
 from youtube_transcript_api import YouTubeTranscriptApi
@@ -15,6 +18,15 @@ from youtube_transcript_api._errors import (
     VideoUnavailable,
 )
 
+# Compiled once at import; these run for every video and transcript
+# Every supported URL form in one alternation, so the URL is scanned once
+_YT_URL_RE = re.compile(
+    r"(?:youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)([a-zA-Z0-9_-]{11})"
+)
+_ID_CHARSET = frozenset(string.ascii_letters + string.digits + "_-")
+# Same matches as r"\[.*?\]", but a negated class can't backtrack
+_BRACKET_RE = re.compile(r"\[[^\]\n]*\]")
+
 
 @dataclass
 class TranscriptSegment:
@@ -33,12 +45,12 @@ class Transcript:
     language: str
     is_generated: bool
 
-    @property
+    @cached_property
     def full_text(self) -> str:
-        """Get the full transcript as a single string"""
-        return " ".join(seg.text for seg in self.segments)
+        """Get the full transcript as a single string (built once per transcript)"""
+        return " ".join([seg.text for seg in self.segments])
 
-    @property
+    @cached_property
     def duration_seconds(self) -> float:
         """Total duration in seconds"""
         if not self.segments:
@@ -55,21 +67,14 @@ class TranscriptFetcher:
 
     def extract_video_id(self, url: str) -> Optional[str]:
         """Extract YouTube video ID from URL"""
-        patterns = [
-            r"(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})",
-            r"youtube\.com/embed/([a-zA-Z0-9_-]{11})",
-            r"youtube\.com/v/([a-zA-Z0-9_-]{11})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-
-        # Maybe it's already just a video ID
-        if re.match(r"^[a-zA-Z0-9_-]{11}$", url):
+        # Maybe it's already just a video ID (no URL form is that short)
+        if len(url) == 11 and _ID_CHARSET.issuperset(url):
             return url
 
+        match = _YT_URL_RE.search(url)
+        if match:
+            return match.group(1)
+
         return None
 
     def fetch_youtube_transcript(
@@ -110,9 +115,9 @@ class TranscriptFetcher:
                     is_generated = True
                 except NoTranscriptFound:
                     # Try any available transcript and translate
-                    available = list(transcript_list)
-                    if available:
-                        transcript = available[0].translate("en")
+                    first = next(iter(transcript_list), None)
+                    if first:
+                        transcript = first.translate("en")
                         is_generated = True
                     else:
                         return None
@@ -151,6 +156,7 @@ class TranscriptFetcher:
         self,
         video_ids: List[str],
         languages: List[str] = None,
+        max_workers: int = 16,
     ) -> List[Transcript]:
         """
         Fetch transcripts for multiple videos
@@ -158,18 +164,19 @@ class TranscriptFetcher:
         Args:
             video_ids: List of video IDs or URLs
             languages: Preferred languages
+            max_workers: Maximum number of videos fetched concurrently
 
         Returns:
             List of successfully fetched transcripts
         """
-        transcripts = []
-
-        for video_id in video_ids:
-            transcript = self.fetch_youtube_transcript(video_id, languages)
-            if transcript:
-                transcripts.append(transcript)
-
-        return transcripts
+        # Each fetch is a blocking HTTP round-trip, so run them on threads;
+        # map() keeps results in the order the videos were given
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda video_id: self.fetch_youtube_transcript(video_id, languages),
+                video_ids,
+            )
+            return [transcript for transcript in results if transcript]
 
     def summarize_transcript(
         self,
@@ -189,18 +196,18 @@ class TranscriptFetcher:
         text = transcript.full_text
 
         # Clean up common transcript artifacts
-        text = re.sub(r"\[.*?\]", "", text)  # Remove [Music], [Laughter], etc.
-        text = re.sub(r"\s+", " ", text)  # Normalize whitespace
-        text = text.strip()
+        if "[" in text:
+            text = _BRACKET_RE.sub("", text)  # Remove [Music], [Laughter], etc.
+        text = " ".join(text.split())  # Normalize and strip whitespace
 
         if len(text) > max_length:
-            # Try to cut at sentence boundary
-            truncated = text[:max_length]
-            last_period = truncated.rfind(".")
-            if last_period > max_length * 0.8:
-                text = truncated[:last_period + 1]
+            # Try to cut at a sentence boundary in the last 20% of the window
+            floor = int(max_length * 0.8) + 1
+            last_period = text.rfind(".", floor, max_length)
+            if last_period != -1:
+                text = text[:last_period + 1]
             else:
-                text = truncated + "..."
+                text = text[:max_length] + "..."
 
         return text
 
@@ -209,6 +216,7 @@ def main():
     """CLI entry point"""
     import argparse
     import json
+    import sys
 
     parser = argparse.ArgumentParser(description="Fetch YouTube transcripts")
     parser.add_argument("videos", nargs="+", help="Video IDs or URLs")
@@ -220,28 +228,40 @@ def main():
     fetcher = TranscriptFetcher()
     transcripts = fetcher.fetch_multiple(args.videos)
 
-    output = []
-    for t in transcripts:
-        data = {
-            "video_id": t.video_id,
-            "language": t.language,
-            "is_generated": t.is_generated,
-            "duration_seconds": t.duration_seconds,
-            "text": fetcher.summarize_transcript(t) if not args.full else t.full_text,
-        }
-        if args.full:
-            data["segments"] = [
-                {"text": s.text, "start": s.start, "duration": s.duration}
-                for s in t.segments
-            ]
-        output.append(data)
+    def entries():
+        for t in transcripts:
+            data = {
+                "video_id": t.video_id,
+                "language": t.language,
+                "is_generated": t.is_generated,
+                "duration_seconds": t.duration_seconds,
+                "text": fetcher.summarize_transcript(t) if not args.full else t.full_text,
+            }
+            if args.full:
+                data["segments"] = [
+                    {"text": s.text, "start": s.start, "duration": s.duration}
+                    for s in t.segments
+                ]
+            yield data
+
+    def write_json_array(out) -> int:
+        # Serialize one entry at a time, matching json.dump(..., indent=2)
+        count = 0
+        out.write("[")
+        for data in entries():
+            out.write(",\n  " if count else "\n  ")
+            out.write(json.dumps(data, indent=2).replace("\n", "\n  "))
+            count += 1
+        out.write("\n]" if count else "]")
+        return count
 
     if args.output:
         with open(args.output, "w") as f:
-            json.dump(output, f, indent=2)
-        print(f"Saved {len(output)} transcripts to {args.output}")
+            count = write_json_array(f)
+        print(f"Saved {count} transcripts to {args.output}")
     else:
-        print(json.dumps(output, indent=2))
+        write_json_array(sys.stdout)
+        print()
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 
 from .podcast_apis import ApplePodcastsAPI, SpotifyAPI, YouTubeAPI
 from .parsers import PodcastPageParser, RSSParser, ParsedPodcastPage
+from .scraping import make_session
 
 __all__ = [
     "ApplePodcastsAPI",
@@ -10,4 +11,5 @@ __all__ = [
     "PodcastPageParser",
     "RSSParser",
     "ParsedPodcastPage",
+    "make_session",
 ]
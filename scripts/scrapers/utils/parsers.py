@@ -5,11 +5,22 @@ Utility functions for parsing podcast websites and extracting information
 
 import re
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from urllib.parse import urljoin, urlparse
 
 from bs4 import BeautifulSoup
 
+from .scraping import HTML_PARSER
+
+# Common title suffixes, stripped in order
+_TITLE_SUFFIXES = (" | Podcast", " - Podcast", " Podcast")
+
+# Common non-contact emails
+_EMAIL_BLOCKLIST = (
+    "example", "noreply", "support", "info@",
+    "privacy", "legal", "admin",
+)
+
 
 @dataclass
 class ParsedPodcastPage:
@@ -31,12 +42,16 @@ class PodcastPageParser:
         r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
     )
 
-    RSS_PATTERNS = [
-        r'type=["\']application/rss\+xml["\']',
-        r'href=["\']([^"\']+\.rss)["\']',
-        r'href=["\']([^"\']+/feed/?)["\']',
+    # Host-name lead-ins, most reliable first ("with" often names a guest)
+    HOST_PATTERNS = [
+        re.compile(r"[Hh]osted by ([A-Z][a-z]+ [A-Z][a-z]+)"),
+        re.compile(r"[Ww]ith ([A-Z][a-z]+ [A-Z][a-z]+)"),
+        re.compile(r"[Hh]ost:?\s*([A-Z][a-z]+ [A-Z][a-z]+)"),
     ]
 
+    # Common category containers, matched in a single select
+    CATEGORY_SELECTOR = ".category, .tag, .genre, [class*='category']"
+
     def __init__(self):
         self.social_domains = {
             "twitter.com": "twitter",
@@ -59,15 +74,22 @@ class PodcastPageParser:
         Returns:
             Parsed podcast page data
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER)
+        # Walk the tree for its text once; host and email extraction share it
+        text = soup.get_text()
+        # The canonical <link> feed goes first; the link walk below then only
+        # looks for RSS anchors when there isn't one
+        rss_feed = self._extract_rss_feed(soup, base_url)
+        # Walk the links once for the mailto, RSS and social lookups
+        mailto, rss_feed, social_links = self._scan_links(soup, base_url, rss_feed)
 
         return ParsedPodcastPage(
             title=self._extract_title(soup),
             description=self._extract_description(soup),
-            host_name=self._extract_host_name(soup),
-            email=self._extract_email(soup),
-            rss_feed=self._extract_rss_feed(soup, base_url),
-            social_links=self._extract_social_links(soup),
+            host_name=self._extract_host_name(text),
+            email=mailto or self._extract_email(text),
+            rss_feed=rss_feed,
+            social_links=social_links,
             categories=self._extract_categories(soup),
         )
 
@@ -83,9 +105,8 @@ class PodcastPageParser:
         if title_tag:
             title = title_tag.get_text().strip()
             # Remove common suffixes
-            for suffix in [" | Podcast", " - Podcast", " Podcast"]:
-                if title.endswith(suffix):
-                    title = title[:-len(suffix)]
+            for suffix in _TITLE_SUFFIXES:
+                title = title.removesuffix(suffix)
             return title
 
         # Try h1
@@ -109,43 +130,54 @@ class PodcastPageParser:
 
         return None
 
-    def _extract_host_name(self, soup: BeautifulSoup) -> Optional[str]:
-        """Try to extract host name from page"""
+    def _extract_host_name(self, text: str) -> Optional[str]:
+        """Try to extract host name from page text"""
         # Look for common patterns
-        patterns = [
-            r"[Hh]osted by ([A-Z][a-z]+ [A-Z][a-z]+)",
-            r"[Ww]ith ([A-Z][a-z]+ [A-Z][a-z]+)",
-            r"[Hh]ost:?\s*([A-Z][a-z]+ [A-Z][a-z]+)",
-        ]
-
-        text = soup.get_text()
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in self.HOST_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
 
         return None
 
-    def _extract_email(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract email address"""
-        # Check mailto links first
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            if href.startswith("mailto:"):
-                email = href.replace("mailto:", "").split("?")[0]
-                return email.lower()
+    def _scan_links(
+        self,
+        soup: BeautifulSoup,
+        base_url: str,
+        rss_feed: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[str], Dict[str, str]]:
+        """Collect the first mailto, first RSS link and social links in one pass"""
+        email = None
+        social = {}
 
-        # Search page text
-        text = soup.get_text()
-        matches = self.EMAIL_PATTERN.findall(text)
-
-        # Filter out common non-contact emails
-        for email in matches:
-            email_lower = email.lower()
-            if not any(x in email_lower for x in [
-                "example", "noreply", "support", "info@",
-                "privacy", "legal", "admin"
-            ]):
+        for link in soup.find_all("a", href=True):
+            href = link["href"]
+
+            if email is None and href.startswith("mailto:"):
+                email = href[len("mailto:"):].split("?")[0].lower()
+
+            if rss_feed is None and href.endswith((".rss", ".xml", "/feed", "/feed/")):
+                text = link.get_text().lower()
+                if "rss" in text or "feed" in text:
+                    rss_feed = urljoin(base_url, href)
+
+            # Match the domain itself or its parent (e.g. mobile.twitter.com)
+            domain = urlparse(href).netloc.removeprefix("www.")
+            platform = (
+                self.social_domains.get(domain)
+                or self.social_domains.get(domain.partition(".")[2])
+            )
+            if platform:
+                social[platform] = href
+
+        return email, rss_feed, social
+
+    def _extract_email(self, text: str) -> Optional[str]:
+        """Extract email address from page text"""
+        # Search page text, stopping at the first contact email
+        for match in self.EMAIL_PATTERN.finditer(text):
+            email_lower = match.group().lower()
+            if not any(x in email_lower for x in _EMAIL_BLOCKLIST):
                 return email_lower
 
         return None
@@ -155,58 +187,32 @@ class PodcastPageParser:
         soup: BeautifulSoup,
         base_url: str
     ) -> Optional[str]:
-        """Extract RSS feed URL"""
-        # Check link tags
+        """Extract RSS feed URL from link tags"""
         rss_link = soup.find("link", type="application/rss+xml")
         if rss_link and rss_link.get("href"):
             return urljoin(base_url, rss_link["href"])
 
-        # Check for RSS links in page
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            text = link.get_text().lower()
-
-            if "rss" in text or "feed" in text:
-                if href.endswith((".rss", ".xml", "/feed", "/feed/")):
-                    return urljoin(base_url, href)
-
         return None
 
-    def _extract_social_links(self, soup: BeautifulSoup) -> Dict[str, str]:
-        """Extract social media profile links"""
-        social = {}
-
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            parsed = urlparse(href)
-            domain = parsed.netloc.replace("www.", "")
-
-            for social_domain, platform in self.social_domains.items():
-                if social_domain in domain:
-                    social[platform] = href
-                    break
-
-        return social
-
     def _extract_categories(self, soup: BeautifulSoup) -> List[str]:
         """Extract podcast categories/tags"""
-        categories = []
+        categories = {}  # Ordered set: dedupes as it collects
 
         # Look for common category containers
-        for selector in [".category", ".tag", ".genre", "[class*='category']"]:
-            elements = soup.select(selector)
-            for el in elements:
-                text = el.get_text().strip()
-                if text and len(text) < 50:  # Reasonable category length
-                    categories.append(text)
+        for el in soup.select(self.CATEGORY_SELECTOR):
+            text = el.get_text().strip()
+            if text and len(text) < 50:  # Reasonable category length
+                categories.setdefault(text, None)
 
-        # Deduplicate
-        return list(set(categories))
+        return list(categories)
 
 
 class RSSParser:
     """Parser for podcast RSS feeds"""
 
+    NAMESPACES = {"itunes": "http://www.itunes.com/dtds/podcast-1.0.dtd"}
+    FEED_CHUNK_SIZE = 65_536
+
     def parse(self, xml_content: str) -> Dict[str, Any]:
         """
         Parse a podcast RSS feed
@@ -217,56 +223,85 @@ class RSSParser:
         Returns:
             Parsed podcast data
         """
-        soup = BeautifulSoup(xml_content, "xml")
+        # Imported here so the rest of utils still loads without lxml
+        from lxml import etree
 
-        channel = soup.find("channel")
-        if not channel:
+        # Stream the feed, freeing each episode once it's been read so large
+        # feeds never hold the whole document in memory
+        episodes = []
+        channel = None
+        try:
+            for event, elem in self._iter_events(xml_content):
+                if event == "start":
+                    if elem.tag == "channel" and channel is None:
+                        channel = elem
+                elif elem.tag == "item" and channel is not None:
+                    episodes.append(self._parse_item(elem))
+                    elem.clear()
+        except etree.XMLSyntaxError:
             return {}
 
-        episodes = []
-        for item in channel.find_all("item"):
-            episode = {
-                "title": self._get_text(item, "title"),
-                "description": self._get_text(item, "description"),
-                "published": self._get_text(item, "pubDate"),
-                "duration": self._get_text(item, "itunes:duration"),
-                "audio_url": self._get_enclosure_url(item),
-            }
-            episodes.append(episode)
+        if channel is None:
+            return {}
 
         return {
             "title": self._get_text(channel, "title"),
             "description": self._get_text(channel, "description"),
             "author": self._get_text(channel, "itunes:author"),
-            "email": self._get_text(channel, "itunes:email"),
+            "email": self._get_text(channel, ".//itunes:email"),
             "website": self._get_text(channel, "link"),
             "image": self._get_image_url(channel),
             "categories": self._get_categories(channel),
             "episodes": episodes,
         }
 
-    def _get_text(self, element, tag: str) -> Optional[str]:
-        """Get text content of a child element"""
-        child = element.find(tag)
-        return child.get_text().strip() if child else None
-
-    def _get_enclosure_url(self, item) -> Optional[str]:
-        """Get audio URL from enclosure tag"""
+    def _iter_events(self, xml_content: str):
+        """Yield (event, element) pairs while feeding the parser in chunks"""
+        from lxml import etree
+
+        # Feeds are often not well-formed (stray '&', HTML entities such as
+        # &nbsp;), so recover like the old BeautifulSoup "xml" parser did.
+        # Entities are never expanded.
+        parser = etree.XMLPullParser(
+            events=("start", "end"),
+            recover=True,
+            resolve_entities=False,
+        )
+        for start in range(0, len(xml_content), self.FEED_CHUNK_SIZE):
+            parser.feed(xml_content[start:start + self.FEED_CHUNK_SIZE])
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+
+    def _parse_item(self, item) -> Dict[str, Optional[str]]:
+        """Extract episode data from an item element"""
         enclosure = item.find("enclosure")
-        return enclosure.get("url") if enclosure else None
+        return {
+            "title": self._get_text(item, "title"),
+            "description": self._get_text(item, "description"),
+            "published": self._get_text(item, "pubDate"),
+            "duration": self._get_text(item, "itunes:duration"),
+            "audio_url": enclosure.get("url") if enclosure is not None else None,
+        }
+
+    def _get_text(self, element, path: str) -> Optional[str]:
+        """Get text content of a child element"""
+        # Unresolved entities (&nbsp;, &ldquo;) become child nodes that split
+        # the text, so join every text node rather than taking .text alone
+        child = element.find(path, self.NAMESPACES)
+        return child.xpath("string()").strip() if child is not None else None
 
     def _get_image_url(self, channel) -> Optional[str]:
         """Get podcast image URL"""
         # Try iTunes image
-        itunes_image = channel.find("itunes:image")
-        if itunes_image and itunes_image.get("href"):
-            return itunes_image["href"]
+        itunes_image = channel.find("itunes:image", self.NAMESPACES)
+        if itunes_image is not None and itunes_image.get("href"):
+            return itunes_image.get("href")
 
         # Try standard image
         image = channel.find("image")
-        if image:
-            url = image.find("url")
-            return url.get_text().strip() if url else None
+        if image is not None:
+            return self._get_text(image, "url")
 
         return None
 
@@ -274,7 +309,7 @@ class RSSParser:
         """Get podcast categories"""
         categories = []
 
-        for cat in channel.find_all("itunes:category"):
+        for cat in channel.iterfind(".//itunes:category", self.NAMESPACES):
             text = cat.get("text")
             if text:
                 categories.append(text)
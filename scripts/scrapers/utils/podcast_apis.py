@@ -3,13 +3,134 @@ Podcast API Wrappers
 Handles API calls to Apple Podcasts, Spotify, and YouTube
 """
 
+import asyncio
 import os
-from typing import List, Dict, Any
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, Tuple
 
 import aiohttp
+import orjson
+
+from .scraping import make_session
+
+# Search and lookup responses are reused for a few minutes
+_CACHE_TTL = 300
+_CACHE_SIZE = 1000
+
+
+class _TTLCache:
+    """LRU cache whose entries also expire after a fixed time"""
+
+    def __init__(self, maxsize: int = _CACHE_SIZE, ttl: float = _CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires, value = entry
+        if time.monotonic() >= expires:
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+class _APIClient:
+    """
+    Base for the API wrappers: one pooled session shared by every call.
+
+    Use as an async context manager (or pass in a session) to pool
+    connections; a bare call opens a short-lived session of its own.
+    """
+
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        # An injected session is shared with the caller and left open on exit
+        self.session = session
+        self._owns_session = session is None
+        self._cache = _TTLCache()
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+
+    async def __aenter__(self):
+        if self.session is None:
+            self.session = make_session()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """Close the session if this client created it"""
+        if self.session and self._owns_session:
+            await self.session.close()
+            self.session = None
+
+    @asynccontextmanager
+    async def _request_session(self):
+        """Yield the shared session, or a session closed after this request"""
+        if self.session is not None:
+            yield self.session
+        else:
+            async with make_session() as session:
+                yield session
+
+    async def _get_json(
+        self,
+        url: str,
+        params: Dict[str, Any] = None,
+        headers: Dict[str, str] = None,
+    ) -> Tuple[int, Any]:
+        """GET a JSON endpoint, returning (status, data) and caching successes"""
+        # The cache holds raw bodies, decoded afresh for every caller, so a
+        # caller editing its results can't change what anyone else gets
+        key = (url, tuple(sorted((params or {}).items())))
+        body = self._cache.get(key)
+        if body is not None:
+            return 200, orjson.loads(body)
+
+        # Identical requests already in flight share its response
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_body(url, params, headers))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        status, body = await asyncio.shield(task)
+        if status != 200:
+            return status, None
+
+        data = orjson.loads(body)
+        self._cache.set(key, body)
+        return 200, data
+
+    async def _fetch_body(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+    ) -> Tuple[int, Optional[bytes]]:
+        """Make the upstream request behind _get_json"""
+        async with self._request_session() as session:
+            async with session.get(url, params=params, headers=headers) as response:
+                if response.status != 200:
+                    return response.status, None
 
+                return 200, await response.read()
 
-class ApplePodcastsAPI:
+
+class ApplePodcastsAPI(_APIClient):
     """Apple Podcasts/iTunes Search API wrapper"""
 
     BASE_URL = "https://itunes.apple.com/search"
@@ -38,14 +159,12 @@ class ApplePodcastsAPI:
             "country": country,
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.BASE_URL, params=params) as response:
-                if response.status != 200:
-                    print(f"Apple API error: {response.status}")
-                    return []
+        status, data = await self._get_json(self.BASE_URL, params)
+        if status != 200:
+            print(f"Apple API error: {status}")
+            return []
 
-                data = await response.json()
-                return data.get("results", [])
+        return data.get("results", [])
 
     async def lookup(self, podcast_id: str) -> Dict[str, Any]:
         """
@@ -62,46 +181,53 @@ class ApplePodcastsAPI:
             "entity": "podcast",
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://itunes.apple.com/lookup",
-                params=params
-            ) as response:
-                if response.status != 200:
-                    return {}
+        status, data = await self._get_json("https://itunes.apple.com/lookup", params)
+        if status != 200:
+            return {}
 
-                data = await response.json()
-                results = data.get("results", [])
-                return results[0] if results else {}
+        results = data.get("results", [])
+        return results[0] if results else {}
 
 
-class SpotifyAPI:
+class SpotifyAPI(_APIClient):
     """Spotify Web API wrapper for podcasts"""
 
     AUTH_URL = "https://accounts.spotify.com/api/token"
     API_BASE = "https://api.spotify.com/v1"
 
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(session)
         self.client_id = os.getenv("SPOTIFY_CLIENT_ID", "")
         self.client_secret = os.getenv("SPOTIFY_CLIENT_SECRET", "")
         self._access_token = None
+        self._token_expiry = 0.0
+        # Concurrent calls wait on one token request instead of each making one
+        self._token_lock = asyncio.Lock()
 
     async def _get_access_token(self) -> str:
-        """Get OAuth access token using client credentials flow"""
-        if not self.client_id or not self.client_secret:
-            raise ValueError("Spotify credentials not configured")
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.AUTH_URL,
-                data={"grant_type": "client_credentials"},
-                auth=aiohttp.BasicAuth(self.client_id, self.client_secret),
-            ) as response:
-                if response.status != 200:
-                    raise Exception(f"Spotify auth failed: {response.status}")
-
-                data = await response.json()
-                return data["access_token"]
+        """Get OAuth access token using client credentials flow, reused until it expires"""
+        async with self._token_lock:
+            if self._access_token and time.monotonic() < self._token_expiry:
+                return self._access_token
+
+            if not self.client_id or not self.client_secret:
+                raise ValueError("Spotify credentials not configured")
+
+            async with self._request_session() as session:
+                async with session.post(
+                    self.AUTH_URL,
+                    data={"grant_type": "client_credentials"},
+                    auth=aiohttp.BasicAuth(self.client_id, self.client_secret),
+                ) as response:
+                    if response.status != 200:
+                        raise Exception(f"Spotify auth failed: {response.status}")
+
+                    data = orjson.loads(await response.read())
+
+            self._access_token = data["access_token"]
+            # Refresh a minute early so a token never expires mid-request
+            self._token_expiry = time.monotonic() + data.get("expires_in", 3600) - 60
+            return self._access_token
 
     async def search(
         self,
@@ -118,32 +244,29 @@ class SpotifyAPI:
         Returns:
             List of podcast results
         """
-        if not self._access_token:
-            try:
-                self._access_token = await self._get_access_token()
-            except Exception as e:
-                print(f"Spotify auth error: {e}")
-                return []
-
-        headers = {"Authorization": f"Bearer {self._access_token}"}
+        try:
+            access_token = await self._get_access_token()
+        except Exception as e:
+            print(f"Spotify auth error: {e}")
+            return []
+
+        headers = {"Authorization": f"Bearer {access_token}"}
         params = {
             "q": query,
             "type": "show",
             "limit": limit,
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.API_BASE}/search",
-                headers=headers,
-                params=params,
-            ) as response:
-                if response.status != 200:
-                    print(f"Spotify search error: {response.status}")
-                    return []
+        status, data = await self._get_json(
+            f"{self.API_BASE}/search",
+            params,
+            headers=headers,
+        )
+        if status != 200:
+            print(f"Spotify search error: {status}")
+            return []
 
-                data = await response.json()
-                return data.get("shows", {}).get("items", [])
+        return data.get("shows", {}).get("items", [])
 
     async def get_show(self, show_id: str) -> Dict[str, Any]:
         """
@@ -155,28 +278,27 @@ class SpotifyAPI:
         Returns:
             Show details
         """
-        if not self._access_token:
-            self._access_token = await self._get_access_token()
-
-        headers = {"Authorization": f"Bearer {self._access_token}"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.API_BASE}/shows/{show_id}",
-                headers=headers,
-            ) as response:
-                if response.status != 200:
-                    return {}
+        access_token = await self._get_access_token()
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        status, data = await self._get_json(
+            f"{self.API_BASE}/shows/{show_id}",
+            headers=headers,
+        )
+        if status != 200:
+            return {}
 
-                return await response.json()
+        return data
 
 
-class YouTubeAPI:
+class YouTubeAPI(_APIClient):
     """YouTube Data API wrapper"""
 
     API_BASE = "https://www.googleapis.com/youtube/v3"
+    CHANNELS_PER_REQUEST = 50  # channels.list accepts up to 50 comma-separated IDs
 
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(session)
         self.api_key = os.getenv("YOUTUBE_API_KEY", "")
 
     async def search_channels(
@@ -206,27 +328,22 @@ class YouTubeAPI:
             "maxResults": limit,
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.API_BASE}/search",
-                params=params,
-            ) as response:
-                if response.status != 200:
-                    print(f"YouTube search error: {response.status}")
-                    return []
-
-                data = await response.json()
-                items = data.get("items", [])
-
-                return [
-                    {
-                        "channelId": item["id"]["channelId"],
-                        "title": item["snippet"]["title"],
-                        "description": item["snippet"]["description"],
-                        "thumbnails": item["snippet"]["thumbnails"],
-                    }
-                    for item in items
-                ]
+        status, data = await self._get_json(f"{self.API_BASE}/search", params)
+        if status != 200:
+            print(f"YouTube search error: {status}")
+            return []
+
+        items = data.get("items", [])
+
+        return [
+            {
+                "channelId": item["id"]["channelId"],
+                "title": item["snippet"]["title"],
+                "description": item["snippet"]["description"],
+                "thumbnails": item["snippet"]["thumbnails"],
+            }
+            for item in items
+        ]
 
     async def get_channel(self, channel_id: str) -> Dict[str, Any]:
         """
@@ -238,26 +355,44 @@ class YouTubeAPI:
         Returns:
             Channel details with statistics
         """
-        if not self.api_key:
-            return {}
+        channels = await self.get_channels([channel_id])
+        return channels[0] if channels else {}
 
-        params = {
-            "key": self.api_key,
-            "part": "snippet,statistics,contentDetails",
-            "id": channel_id,
-        }
+    async def get_channels(self, channel_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get details for many channels, up to 50 per request
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.API_BASE}/channels",
-                params=params,
-            ) as response:
-                if response.status != 200:
-                    return {}
+        Args:
+            channel_ids: YouTube channel IDs
 
-                data = await response.json()
-                items = data.get("items", [])
-                return items[0] if items else {}
+        Returns:
+            Channel details with statistics for each channel found
+        """
+        if not self.api_key or not channel_ids:
+            return []
+
+        batches = [
+            channel_ids[i:i + self.CHANNELS_PER_REQUEST]
+            for i in range(0, len(channel_ids), self.CHANNELS_PER_REQUEST)
+        ]
+        responses = await asyncio.gather(*[
+            self._get_json(
+                f"{self.API_BASE}/channels",
+                {
+                    "key": self.api_key,
+                    "part": "snippet,statistics,contentDetails",
+                    "id": ",".join(batch),
+                },
+            )
+            for batch in batches
+        ])
+
+        return [
+            item
+            for status, data in responses
+            if status == 200
+            for item in data.get("items", [])
+        ]
 
     async def get_channel_videos(
         self,
@@ -286,22 +421,17 @@ class YouTubeAPI:
             "maxResults": limit,
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.API_BASE}/search",
-                params=params,
-            ) as response:
-                if response.status != 200:
-                    return []
-
-                data = await response.json()
-                return [
-                    {
-                        "videoId": item["id"]["videoId"],
-                        "title": item["snippet"]["title"],
-                        "description": item["snippet"]["description"],
-                        "publishedAt": item["snippet"]["publishedAt"],
-                        "thumbnails": item["snippet"]["thumbnails"],
-                    }
-                    for item in data.get("items", [])
-                ]
+        status, data = await self._get_json(f"{self.API_BASE}/search", params)
+        if status != 200:
+            return []
+
+        return [
+            {
+                "videoId": item["id"]["videoId"],
+                "title": item["snippet"]["title"],
+                "description": item["snippet"]["description"],
+                "publishedAt": item["snippet"]["publishedAt"],
+                "thumbnails": item["snippet"]["thumbnails"],
+            }
+            for item in data.get("items", [])
+        ]
@@ -0,0 +1,58 @@
+"""
+Scraping Helpers
+Shared HTTP session setup, HTML parser choice and email pattern
+"""
+
+import re
+
+import aiohttp
+
+# Resolve DNS on the event loop instead of a thread pool when aiodns is installed
+try:
+    import aiodns  # noqa: F401
+    from aiohttp.resolver import AsyncResolver
+except ImportError:
+    AsyncResolver = None
+
+# Prefer the C-based lxml parser, falling back to the stdlib one
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Pages are scanned as raw bytes. Each domain label ends at its own dot, so
+# the host and TLD parts can't be split ambiguously while backtracking.
+EMAIL_RE = re.compile(rb'\b[A-Za-z0-9._%+-]+@(?:[A-Za-z0-9-]+\.)+[A-Za-z]{2,24}\b')
+
+USER_AGENT = "PodcastOutreach/1.0"
+
+# How many pages of one website are fetched at once
+PAGES_PER_SITE = 5
+
+
+def make_session(**kwargs) -> aiohttp.ClientSession:
+    """
+    Create a ClientSession with its own pooled connector
+
+    Every call builds a new connector, so connections are only reused by
+    callers holding the same session; pass one session around to share a pool.
+
+    Args:
+        kwargs: Extra ClientSession arguments (e.g. timeout)
+
+    Returns:
+        A new session; the caller is responsible for closing it
+    """
+    kwargs.setdefault("headers", {"User-Agent": USER_AGENT})
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            resolver=AsyncResolver() if AsyncResolver else None,
+            limit=200,
+            limit_per_host=10,  # Keep-alive reuse across requests to one host
+            use_dns_cache=True,
+            ttl_dns_cache=600,
+            keepalive_timeout=60,
+        ),
+        **kwargs,
+    )